@@ -2,12 +2,46 @@ from abc import ABC, abstractmethod
 from langchain_openai import ChatOpenAI
 from langchain_community.llms import HuggingFaceEndpoint
 from langchain.schema import SystemMessage, HumanMessage
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import os
+import threading
+import time
 import requests
 from config import AVAILABLE_MODELS
 import huggingface_hub
 
+# LLM clients hold no conversation state, so agents built with the same settings share one
+# (and its connection pool) instead of creating a new client per agent instance. The table is
+# a small LRU keyed on a digest of the API key, and clients idle for longer than the TTL are
+# dropped so a user's key is not kept around after their session
+_LLM_CLIENTS_MAXSIZE = 8
+_LLM_CLIENT_TTL = 900
+_llm_clients: Dict[Tuple, Tuple[Any, float]] = OrderedDict()
+_llm_clients_lock = threading.Lock()
+
+def _secret_digest(secret: str | None) -> str | None:
+    """Digest an API key so it can identify a client without being stored"""
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest() if secret else None
+
+def _shared_llm(key: Tuple, create):
+    """Return the LLM client for the given settings, creating it on first use"""
+    now = time.monotonic()
+    with _llm_clients_lock:
+        for stale_key in [k for k, (_, last_used) in _llm_clients.items() if now - last_used > _LLM_CLIENT_TTL]:
+            del _llm_clients[stale_key]
+        
+        if key in _llm_clients:
+            client = _llm_clients.pop(key)[0]
+        else:
+            client = create()
+        _llm_clients[key] = (client, now)
+        while len(_llm_clients) > _LLM_CLIENTS_MAXSIZE:
+            _llm_clients.popitem(last=False)
+        return client
+
 class BaseAgent(ABC):
     def __init__(self, config: Dict[str, Any]):
         self.config = config
@@ -28,16 +62,20 @@ class BaseAgent(ABC):
                     raise ValueError("HuggingFace API key not provided in config")
                 
                 # Initialize HuggingFaceEndpoint with proper configuration
-                self.llm = HuggingFaceEndpoint(
-                    endpoint_url=f"https://api-inference.huggingface.co/models/{model_name}",
-                    huggingfacehub_api_token=hf_token,
-                    task="text-generation",
-                    temperature=config.get("temperature", 0.7),
-                    max_new_tokens=256,
-                    top_k=50,
-                    top_p=0.95,
-                    do_sample=True,
-                    return_full_text=False
+                temperature = config.get("temperature", 0.7)
+                self.llm = _shared_llm(
+                    ("huggingface", model_name, _secret_digest(hf_token), temperature),
+                    lambda: HuggingFaceEndpoint(
+                        endpoint_url=f"https://api-inference.huggingface.co/models/{model_name}",
+                        huggingfacehub_api_token=hf_token,
+                        task="text-generation",
+                        temperature=temperature,
+                        max_new_tokens=256,
+                        top_k=50,
+                        top_p=0.95,
+                        do_sample=True,
+                        return_full_text=False
+                    )
                 )
             except Exception as e:
                 raise RuntimeError(f"Error initializing HuggingFace model: {str(e)}")
@@ -47,10 +85,12 @@ class BaseAgent(ABC):
             if model_name not in AVAILABLE_MODELS["premium"]:
                 model_name = "gpt-4o-mini"  # Default to gpt-4o-mini if invalid model
             
-            self.llm = ChatOpenAI(
-                model=model_name,
-                temperature=config.get("temperature", 0.7),
-                max_tokens=config.get("max_tokens", 1000)
+            temperature = config.get("temperature", 0.7)
+            max_tokens = config.get("max_tokens", 1000)
+            # The client reads the API key from the environment, so its digest is part of the key
+            self.llm = _shared_llm(
+                ("openai", model_name, temperature, max_tokens, _secret_digest(os.getenv("OPENAI_API_KEY"))),
+                lambda: ChatOpenAI(model=model_name, temperature=temperature, max_tokens=max_tokens)
             )
         
         self.memory: List[Dict[str, Any]] = []
@@ -68,8 +108,8 @@ class BaseAgent(ABC):
         """
         pass
     
-    def _create_prompt(self, role: str, content: str) -> str:
-        """Create a prompt for the LLM"""
+    def _build_llm_input(self, role: str, content: str):
+        """Format a role and content into the input expected by the configured LLM"""
         if self.is_free_tier:
             model_name = self.config.get("model", "gpt2")
             
@@ -87,24 +127,71 @@ class BaseAgent(ABC):
                 role = ' '.join(role_words[:30]) + "..."
             
             if "llama" in model_name.lower():
-                prompt = f"[INST]{role}[/INST]{content}"  # Minimized format
+                return f"[INST]{role}[/INST]{content}"  # Minimized format
             elif "t5" in model_name.lower():
-                prompt = f"System:{role} Input:{content}"  # Minimized format
+                return f"System:{role} Input:{content}"  # Minimized format
             else:
-                prompt = f"{role}\nQ:{content}\nA:"  # Most minimal format
-            
+                return f"{role}\nQ:{content}\nA:"  # Most minimal format
+        
+        # For OpenAI, use the chat format
+        return [
+            SystemMessage(content=role),
+            HumanMessage(content=content)
+        ]
+    
+    def _create_prompt(self, role: str, content: str) -> str:
+        """Create a prompt for the LLM"""
+        llm_input = self._build_llm_input(role, content)
+        if self.is_free_tier:
             try:
-                response = self.llm.invoke(prompt)
+                response = self.llm.invoke(llm_input)
                 return response
             except Exception as e:
                 raise RuntimeError(f"Error generating response: {str(e)}")
         else:
-            # For OpenAI, use the chat format
-            messages = [
-                SystemMessage(content=role),
-                HumanMessage(content=content)
-            ]
-            return self.llm.invoke(messages).content
+            return self.llm.invoke(llm_input).content
+    
+    def _create_prompts(self, prompts: List[Tuple[str, str]], max_concurrency: int = 5,
+                        on_response: Callable[[int, str], None] | None = None) -> List[str]:
+        """
+        Create several (role, content) prompts concurrently
+        
+        Each prompt is its own request and retries on its own. Every prompt runs to completion
+        even if another fails, and on_response is called with (index, response) for each one
+        that succeeds; the first failure is re-raised once all prompts have finished. A thread
+        pool is used rather than the LLM's batch(), which completion-style LLMs such as
+        HuggingFaceEndpoint run one prompt at a time.
+        """
+        if not prompts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(prompts))) as executor:
+            futures = [executor.submit(self._create_prompt_with_retry, *prompt) for prompt in prompts]
+        
+        responses = []
+        error = None
+        for i, future in enumerate(futures):
+            try:
+                response = future.result()
+            except Exception as e:
+                error = error or e
+                continue
+            if on_response is not None:
+                on_response(i, response)
+            responses.append(response)
+        if error is not None:
+            raise error
+        return responses
+    
+    def _create_prompt_with_retry(self, role: str, content: str, max_retries: int = 3,
+                                  backoff: float = 1.0) -> str:
+        """Create a prompt, retrying with exponential backoff on provider errors"""
+        for attempt in range(max_retries):
+            try:
+                return self._create_prompt(role, content)
+            except Exception:
+                if attempt == max_retries - 1:
+                    raise
+                time.sleep(backoff * (2 ** attempt))
     
     def save_to_memory(self, interaction: Dict[str, Any]):
         """Save interaction to agent's memory"""
@@ -86,26 +86,24 @@ class CoordinatorAgent(BaseAgent):
                 "confidence_score": 0.5
             }
         
-        confidence_scores = {}
-        if enabled_agents.get("news_agent", True):
-            confidence_scores["news"] = analyses["news"].get("confidence_score", 0)
-        if enabled_agents.get("reflection_agent", True):
-            confidence_scores["reflection"] = analyses["reflection"].get("reflection_analysis", {}).get("confidence_score", 0)
-        if enabled_agents.get("debate_agent", True):
-            confidence_scores["debate"] = analyses["debate"].get("confidence_score", 0)
+        # Only analyses from enabled agents count towards confidence
+        live_analyses = {
+            name: analyses[name]
+            for name in ("news", "reflection", "debate")
+            if enabled_agents.get(f"{name}_agent", True)
+        }
+        
+        confidence_scores = {
+            name: self._agent_confidence(name, analysis)
+            for name, analysis in live_analyses.items()
+        }
         print(f"Confidence scores: {confidence_scores}")
         
         weights = self._get_agent_weights(confidence_scores, data.get("historical_decisions", []))
         print(f"Weights: {weights}")
 
         # Synthesize all analyses
-        final_decision = self._synthesize_analyses(
-            analyses["news"],
-            analyses["reflection"],
-            analyses["debate"],
-            data,
-            weights
-        )
+        final_decision = self._synthesize_analyses(analyses, data, weights)
 
         print(f"Final decision: {final_decision}")
         
@@ -113,13 +111,7 @@ class CoordinatorAgent(BaseAgent):
             "final_decision": final_decision,
             "component_analyses": analyses,
             "timestamp": data.get("timestamp"),
-            "confidence_score": self._calculate_overall_confidence(
-                analyses["news"],
-                analyses["reflection"],
-                analyses["debate"],
-                enabled_agents,
-                weights
-            ),
+            "confidence_score": self._calculate_overall_confidence(live_analyses, weights),
         }
         
         self.save_to_memory(analysis_result)
@@ -127,17 +119,15 @@ class CoordinatorAgent(BaseAgent):
     
     def _synthesize_analyses(
         self,
-        news_analysis: Dict[str, Any] | None,
-        reflection_analysis: Dict[str, Any] | None,
-        debate_analysis: Dict[str, Any] | None,
+        analyses: Dict[str, Dict[str, Any]],
         context: Dict[str, Any],
         weights: Dict[str, float]
     ) -> Dict[str, Any]:
         """Synthesize analyses from all agents into final decision"""
-        # Handle None values with default empty dictionaries
-        news_analysis = news_analysis or {}
-        reflection_analysis = reflection_analysis or {}
-        debate_analysis = debate_analysis or {}
+        # Agents missing from analyses fall back to empty dictionaries
+        news_analysis = analyses.get("news", {})
+        reflection_analysis = analyses.get("reflection", {})
+        debate_analysis = analyses.get("debate", {})
 
         role = """You are a master trading strategist responsible for making the final 
         trading decision based on multiple perspectives and analyses. For each symbol,
@@ -284,38 +274,26 @@ class CoordinatorAgent(BaseAgent):
             return True
         return False
     
+    def _agent_confidence(self, agent: str, analysis: Dict[str, Any]) -> float:
+        """Get the confidence score reported in an agent's analysis"""
+        if agent == "reflection":
+            return analysis.get("reflection_analysis", {}).get("confidence_score", 0)
+        return analysis.get("confidence_score", 0)
+    
     def _calculate_overall_confidence(
         self,
-        news_analysis: Dict[str, Any],
-        reflection_analysis: Dict[str, Any],
-        debate_analysis: Dict[str, Any],
-        enabled_agents: Dict[str, bool],
+        analyses: Dict[str, Dict[str, Any]],
         weights: Dict[str, float]
     ) -> float:
-        """Calculate overall confidence score based on enabled analyses"""
+        """Calculate overall confidence score from the analyses of enabled agents"""
+        default_weights = {"news": 0.33, "reflection": 0.34, "debate": 0.33}
         weighted_scores = []
         total_weight = 0
         
-        # Add debate confidence if enabled
-        if enabled_agents.get("debate_agent", True):
-            debate_weight = weights.get("debate", 0.33)
-            debate_confidence = debate_analysis.get("confidence_score", 0)
-            weighted_scores.append(debate_confidence * debate_weight)
-            total_weight += debate_weight
-        
-        # Add reflection confidence if enabled
-        if enabled_agents.get("reflection_agent", True):
-            reflection_weight = weights.get("reflection", 0.34)
-            reflection_confidence = reflection_analysis.get("reflection_analysis", {}).get("confidence_score", 0)
-            weighted_scores.append(reflection_confidence * reflection_weight)
-            total_weight += reflection_weight
-        
-        # Add news confidence if enabled
-        if enabled_agents.get("news_agent", True):
-            news_weight = weights.get("news", 0.33)
-            news_confidence = news_analysis.get("confidence_score", 0)
-            weighted_scores.append(news_confidence * news_weight)
-            total_weight += news_weight
+        for agent, analysis in analyses.items():
+            agent_weight = weights.get(agent, default_weights[agent])
+            weighted_scores.append(self._agent_confidence(agent, analysis) * agent_weight)
+            total_weight += agent_weight
         
         # Calculate weighted average, ensuring we don't divide by zero
         if total_weight > 0:
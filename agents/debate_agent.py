@@ -1,11 +1,102 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Tuple
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import json
+import re
+import threading
 from agents import BaseAgent
 from agents.debate_memory import MemorySummaryAgent
 
+DOMAIN_POSITIVE_TERMS = [
+    'strong momentum', 'investor confidence', 'reinforcing a positive outlook', 'upward momentum', 
+    'robust interest', 'healthy demand', 'resilience', 'favorable outlook', 'clearly', 'strongly', 
+    'definitely', 'consistently', 'well-supported', 'firm evidence', 'high conviction', 'no doubt', 
+    'strongly grounded', 'robust evidence', 'unwavering', 'highly credible', 'solid foundation',
+    'conclusive', 'authoritative', 'well-substantiated'
+]
+
+DOMAIN_NEGATIVE_TERMS = [
+    'regulatory scrutiny', 'downward movement', 'selling pressure', 'challenges', 'volatility', 'pressure',
+    'possibly', 'might', 'unclear', 'uncertain', 'tentative', 'questionable', 'ambiguous', 'unverified', 
+    'guesswork', 'speculation', 'lack of clarity', 'insufficient data', 'doubtfully', 'not guaranteed', 
+    'inconclusive', 'skeptical', 'dubious', 'no clear evidence'
+]
+
+# Each domain term owns one bit, so a text's hits are a single int and the
+# positive/negative counts are popcounts against these masks
+_DOMAIN_TERMS = DOMAIN_POSITIVE_TERMS + DOMAIN_NEGATIVE_TERMS
+_TERM_BITS = {t: 1 << i for i, t in enumerate(_DOMAIN_TERMS)}
+POSITIVE_TERMS_MASK = sum(_TERM_BITS[t] for t in DOMAIN_POSITIVE_TERMS)
+NEGATIVE_TERMS_MASK = sum(_TERM_BITS[t] for t in DOMAIN_NEGATIVE_TERMS)
+
+
+def _scan_domain_terms_in(text: str) -> int:
+    # One C-level substring search per term; measured faster than a single regex sweep
+    mask = 0
+    for term, bit in _TERM_BITS.items():
+        if term in text:
+            mask |= bit
+    return mask
+
+
+def _scan_domain_terms(text: str) -> int:
+    """Return a bitmask of the domain terms occurring anywhere in the (lowercased) text"""
+    return _scan_domain_terms_in(text)
+
+
+def _round_score(unanimous: int, split: int, positive: int, negative: int) -> float:
+    """Confidence contribution of one debate round before weighting by its round number"""
+    return 0.1 * unanimous - 0.05 * split + 0.005 * positive - 0.005 * negative
+
+
+# Every round's inputs are small counts, so scores for up to the five stocks the app
+# allows are tabulated once; larger rounds fall back to _round_score
+_MAX_TABULATED_STOCKS = 5
+_ROUND_SCORES = {
+    (unanimous, split, positive, negative): _round_score(unanimous, split, positive, negative)
+    for unanimous in range(_MAX_TABULATED_STOCKS + 1)
+    for split in range(_MAX_TABULATED_STOCKS + 1 - unanimous)
+    for positive in range(len(DOMAIN_POSITIVE_TERMS) + 1)
+    for negative in range(len(DOMAIN_NEGATIVE_TERMS) + 1)
+}
+
+def _normalize_whitespace(text: str) -> str:
+    """Strip source indentation from a multi-line prompt so it is sent compactly and byte-stable"""
+    return "\n".join(line.strip() for line in text.strip().splitlines())
+
+
+# Matches "Stock: SYMBOL - Bullish ..." lines; stances other than Bullish/Bearish count as neutral
+_STANCE_LINE_RE = re.compile(
+    r"^[^\S\n]*stock:([^-\n]*)-[^\S\n]*(bullish|bearish)?", re.IGNORECASE | re.MULTILINE
+)
+
+
+def _iter_stances(text: str):
+    """Yield (symbol, stance) for every stance line in an analyst's argument"""
+    for match in _STANCE_LINE_RE.finditer(text):
+        stance = match.group(2)
+        yield match.group(1).strip(), stance.lower() if stance else "neutral"
+
+
 class DebateAgent(BaseAgent):
+    # LLM responses keyed on a digest of (model, temperature, role, content), shared by all
+    # instances so replayed debates (e.g. backtests over the same bars) skip the round-trip
+    _prompt_cache: "OrderedDict[str, str]" = OrderedDict()
+    _prompt_cache_lock = threading.Lock()
+    prompt_cache_size = 4096
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.debate_rounds = 3
+        # Roles within a round only depend on earlier rounds, so their LLM calls run concurrently
+        self.max_concurrency = config.get("max_concurrency", 5)
+        # Stop debating once a majority of the expert roles agree on every stock.
+        # Round-0 agreement is only trusted when at least this share of experts agree.
+        self.expert_roles = ["fundamental", "technical", "risk"]
+        self.consensus_threshold = config.get("consensus_threshold", 1.0)
+        # An opening-round consensus is summarized client-side unless synthesis is forced
+        self.force_synthesize = config.get("force_synthesize", False)
         self.roles = [
             {
                 "name": "always_bull",
@@ -39,9 +130,14 @@ class DebateAgent(BaseAgent):
                                 You must explicitly address (refute or justify) the points in the short-term memory from the previous round that contradict your stance or reinforce it."""
             }
         ]
+        # Role descriptions lead every opening-round prompt, so send them without indentation noise
+        for role in self.roles:
+            role["description"] = _normalize_whitespace(role["description"])
         self.memory_summarizer = MemorySummaryAgent(config=config)
-        self.mid_term_memory = []
-        self.short_term_memory = []
+        # Mid-term memory is capped so long-running sessions (e.g. backtests) don't grow the prompts
+        # without bound; short-term memory only ever holds the latest round summary
+        self.mid_term_memory = deque(maxlen=config.get("mid_term_memory_size", 32))
+        self.short_term_memory: str | None = None
     
     def analyze(self, data: Dict[str, Any]) -> Dict[str, Any]:
         market_data = data.get("market_data", {})
@@ -49,138 +145,225 @@ class DebateAgent(BaseAgent):
         news_analysis = data.get("news_analysis", {})
         reflection_analysis = data.get("reflection_analysis", {})
 
-        # Add context to roles based on other agents' analyses
-        enhanced_roles = []
-        for role in self.roles:
-            role_info = role.copy()
-            
-            # Add context to role description
-            context_additions = f"""
+        # Add context to roles based on other agents' analyses; the reflection is left out
+        # when none was given (the app runs it alongside the debate)
+        context_additions = f"""
             Consider the following additional context in your analysis:
             
             News Analysis:
             {news_analysis}
-            
+            """
+        if reflection_analysis:
+            context_additions += f"""
             Reflection Analysis:
             {reflection_analysis}
             """
-            
+
+        enhanced_roles = []
+        for role in self.roles:
+            role_info = role.copy()
             role_info["description"] = role_info["description"] + context_additions
             enhanced_roles.append(role_info)
         
         # Use enhanced roles for debate
-        debate_results = self._conduct_debate(market_data, proposed_action, enhanced_roles)
+        debate = self._conduct_debate(market_data, proposed_action, enhanced_roles)
+        debate_results = debate["debate_rounds"]
         
-        final_analysis = self._synthesize_debate(debate_results)
+        if debate["consensus_round"] == 1 and not self.force_synthesize:
+            final_analysis = self._summarize_consensus(debate["final_stances"], debate["history"])
+        else:
+            final_analysis = self._synthesize_debate(
+                debate["history"], self._get_mid_term_info(), self._get_short_term_info()
+            )
         
         analysis_result = {
             "debate_analysis": final_analysis,
             "debate_rounds": debate_results,
             "timestamp": data.get("timestamp"),
-            "confidence_score": self._calculate_confidence(debate_results, market_data)
+            "confidence_score": self._calculate_confidence(debate_results, market_data, debate["expert_rounds"])
         }
         
         self.save_to_memory(analysis_result)
         return analysis_result
     
     def _conduct_debate(self, market_data: Dict[str, Any], proposed_action: Dict[str, Any], 
-                       enhanced_roles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                       enhanced_roles: List[Dict[str, Any]]) -> Dict[str, Any]:
         debate_rounds = []
+        # Per round, the experts' parsed stances and lowercased arguments, built once as the
+        # round completes and reused for confidence scoring
+        expert_rounds = {}
+        # Formatted history grows by one entry per argument instead of being rebuilt each round
+        history_parts = []
         stocks = sorted(market_data.keys())
-
-        for round_num in range(self.debate_rounds):
-            round_results = []
-            for role_info in enhanced_roles:
-                if round_num == 0:
-                    role = role_info["description"]
-                else:
-                    role = f"""You are the {role_info['name']} analyst. Continue focusing on your domain.
-                               You may change Bullish/Bearish stance freely this round.
-                               You must explicitly refute or support previous round's differing opinions from the short-term memory.
-                               If you maintain your previous stance, justify it against the arguments in short-term memory.
-                               If you change your stance, explain why you changed in response to previous arguments.
-                               """
-
-                perspective_name = role_info["name"]
-
-                stock_instructions = "\n".join(
-                    [f"{i+1}. {symbol}: {market_data[symbol]}" for i, symbol in enumerate(stocks)]
+        # Serialize the payloads once; they are identical in every role's prompt
+        stock_instructions = "\n".join(
+            [f"{i+1}. {symbol}: {json.dumps(market_data[symbol], default=str)}" for i, symbol in enumerate(stocks)]
+        )
+        action_str = json.dumps(proposed_action, default=str)
+
+        # Role prompts of a round run concurrently. Each round's prompts read the previous
+        # round's summary, so only the final round's summary (read by synthesis alone) runs
+        # in the background while the round is scored
+        pending_summaries = []
+        consensus_round = None
+        with ThreadPoolExecutor(max_workers=1) as summary_executor:
+            for round_num in range(self.debate_rounds):
+                self._record_summaries(pending_summaries, wait=True)
+
+                # Memory and history only change between rounds, so format them once per round
+                mid_term_info = self._get_mid_term_info()
+                short_term_info = self._get_short_term_info()
+                previous_arguments = "\n".join(history_parts) if history_parts else "No previous arguments."
+
+                perspectives = []
+                prompts = []
+                for role_info in enhanced_roles:
+                    if round_num == 0:
+                        role = role_info["description"]
+                    else:
+                        role = _normalize_whitespace(f"""You are the {role_info['name']} analyst. Continue focusing on your domain.
+                                   You may change Bullish/Bearish stance freely this round.
+                                   You must explicitly refute or support previous round's differing opinions from the short-term memory.
+                                   If you maintain your previous stance, justify it against the arguments in short-term memory.
+                                   If you change your stance, explain why you changed in response to previous arguments.
+                                   """)
+
+                    perspective_name = role_info["name"]
+
+                    # Shared sections come first so every role's prompt in a round has the
+                    # same long prefix for server-side prefix caching
+                    content = f"""
+                    Market Data for each stock:
+                    {stock_instructions}
+
+                    Proposed Action:
+                    {action_str}
+
+                    Mid-term Memory (accumulated):
+                    {mid_term_info}
+
+                    Short-term Memory (last round only):
+                    {short_term_info}
+
+                    Previous Arguments:
+                    {previous_arguments}
+
+                    Round {round_num + 1} of debate ({perspective_name.upper()}):
+
+                    Instructions:
+                    - For each stock listed above, choose either Bullish or Bearish stance. You may change your stance from previous rounds.
+                    - You must explicitly address (refute or justify) viewpoints from the Short-term Memory that contradict your stance or reinforce it.
+                    - Provide a short but specific viewpoint (4-5 sentences max) referencing these arguments.
+                    - Format the output so that for each stock you produce exactly one line:
+                        "Stock: SYMBOL - Bullish(or Bearish) Your short viewpoint"
+                    - Do this in the same order as the stocks are listed.
+                    - Keep it concise and debate-like. Use adjective-rich language to convey confidence and expertise.
+                    """
+
+                    perspectives.append(perspective_name)
+                    prompts.append((role, content))
+
+                responses = self._cached_prompts(prompts)
+
+                # The round is kept as parallel perspective/response lists; dicts are only
+                # materialized for the returned debate history
+                debate_rounds.extend(
+                    {"round": round_num + 1, "perspective": perspective, "arguments": response}
+                    for perspective, response in zip(perspectives, responses)
+                )
+                history_parts.extend(
+                    self._format_round(round_num + 1, perspective, response)
+                    for perspective, response in zip(perspectives, responses)
                 )
 
-                content = f"""
-                Round {round_num + 1} of debate ({perspective_name.upper()}):
-
-                Market Data for each stock:
-                {stock_instructions}
-
-                Proposed Action:
-                {proposed_action}
-
-                Mid-term Memory (accumulated):
-                {self._get_mid_term_info()}
-
-                Short-term Memory (last round only):
-                {self._get_short_term_info()}
-
-                Previous Arguments:
-                {self._format_previous_rounds(debate_rounds)}
+                expert_arguments = {
+                    perspective: response for perspective, response in zip(perspectives, responses)
+                    if perspective in self.expert_roles
+                }
+                expert_stances = {
+                    perspective: list(_iter_stances(response))
+                    for perspective, response in expert_arguments.items()
+                }
+                stock_stances = self._extract_stock_stances(expert_stances.values(), stocks)
+                expert_rounds[round_num + 1] = {
+                    "stances": expert_stances,
+                    "text": self._join_lowercase(expert_arguments.values())
+                }
+
+                if self._has_consensus(stock_stances, len(expert_arguments), round_num):
+                    consensus_round = round_num + 1
+                    # An opening-round consensus is summarized from the stances alone, so
+                    # nothing would read this round's memory summary
+                    if round_num > 0 or self.force_synthesize:
+                        pending_summaries.append(
+                            summary_executor.submit(self.memory_summarizer.summarize_speeches, responses)
+                        )
+                    break
+
+                pending_summaries.append(
+                    summary_executor.submit(self.memory_summarizer.summarize_speeches, responses)
+                )
 
-                Instructions:
-                - For each stock listed above, choose either Bullish or Bearish stance. You may change your stance from previous rounds.
-                - You must explicitly address (refute or justify) viewpoints from the Short-term Memory that contradict your stance or reinforce it.
-                - Provide a short but specific viewpoint (4-5 sentences max) referencing these arguments.
-                - Format the output so that for each stock you produce exactly one line:
-                    "Stock: SYMBOL - Bullish(or Bearish) Your short viewpoint"
-                - Do this in the same order as the stocks are listed.
-                - Keep it concise and debate-like. Use adjective-rich language to convey confidence and expertise.
-                """
+            self._record_summaries(pending_summaries, wait=True)
 
-                response = self._create_prompt(role, content)
-                round_results.append({
-                    "round": round_num + 1,
-                    "perspective": perspective_name,
-                    "arguments": response
-                })
+        return {
+            "debate_rounds": debate_rounds,
+            "history": "\n".join(history_parts) if history_parts else "No previous arguments.",
+            "expert_rounds": expert_rounds,
+            "consensus_round": consensus_round,
+            "final_stances": stock_stances
+        }
 
-            debate_rounds.extend(round_results)
+    def _join_lowercase(self, arguments: Iterable[str]) -> str:
+        """Lowercase arguments into one line-normalized text for keyword scanning"""
+        return " ".join(
+            line.strip() for text in arguments for line in text.lower().strip().split('\n')
+        )
 
-            stock_stances = self._extract_stock_stances(round_results, stocks)
 
-            last_round_num = round_results[-1]['round']
-            this_round_data = [r['arguments'] for r in round_results if r['round'] == last_round_num]
-            round_summary = self.memory_summarizer.summarize_speeches(this_round_data)
-            self.short_term_memory.clear()
-            self.memory_summarizer.add_to_short_term_memory(self.short_term_memory, round_summary)
+    def _record_summaries(self, pending_summaries: List[Future], wait: bool):
+        """Move finished round summaries, in round order, into short- and mid-term memory"""
+        while pending_summaries and (wait or pending_summaries[0].done()):
+            round_summary = pending_summaries.pop(0).result()
+            self.short_term_memory = round_summary
             self.memory_summarizer.add_to_mid_term_memory(self.mid_term_memory, round_summary)
 
-        return debate_rounds
-
-
-    def _extract_stock_stances(self, round_data: List[Dict[str, Any]], stocks: List[str]) -> Dict[str, List[str]]:
+    def _majority(self, stances: List[str], voters: int) -> str | None:
+        """Return the stance held by more than half of the voters, if any"""
+        for stance in ("bullish", "bearish"):
+            if stances.count(stance) * 2 > voters:
+                return stance
+        return None
+
+    def _has_consensus(self, stock_stances: Dict[str, List[str]], voters: int, round_num: int) -> bool:
+        """Check whether the experts reached a majority stance on every stock"""
+        if not stock_stances or voters == 0:
+            return False
+
+        for stances in stock_stances.values():
+            majority = self._majority(stances, voters)
+            if majority is None:
+                return False
+            # Consensus in the opening round is frequently wrong, so require stronger agreement there
+            if round_num == 0 and stances.count(majority) < self.consensus_threshold * voters:
+                return False
+
+        return True
+
+    def _extract_stock_stances(self, parsed_arguments: Iterable[List[Tuple[str, str]]],
+                               stocks: List[str]) -> Dict[str, List[str]]:
         stances_per_stock = {s: [] for s in stocks}
+        symbols_lower = {s.lower(): s for s in stocks}
 
-        for r in round_data:
-            arguments = r['arguments'].strip().split('\n')
-            for line in arguments:
-                line = line.strip().lower()
-                if line.startswith("stock:"):
-                    parts = line.split('-')
-                    if len(parts) < 2:
-                        continue
-                    symbol_part = parts[0].replace("stock:", "").strip()
-                    stance_part = parts[1].strip()
-                    symbol = symbol_part
-                    if symbol in stances_per_stock:
-                        if stance_part.startswith("bullish"):
-                            stances_per_stock[symbol].append("bullish")
-                        elif stance_part.startswith("bearish"):
-                            stances_per_stock[symbol].append("bearish")
-                        else:
-                            stances_per_stock[symbol].append("neutral")
+        for parsed in parsed_arguments:
+            for symbol, stance in parsed:
+                symbol = symbols_lower.get(symbol.lower())
+                if symbol in stances_per_stock:
+                    stances_per_stock[symbol].append(stance)
 
         return stances_per_stock
 
-    def _synthesize_debate(self, debate_rounds: List[Dict[str, Any]]) -> str:
+    def _synthesize_debate(self, history_str: str, mid_str: str, short_str: str) -> str:
         role = """You are a senior market strategist tasked with synthesizing insights 
                     from five specialized analysts (fundamental, technical, risk, always_bull, always_bear) for multiple stocks."""
         
@@ -188,13 +371,13 @@ class DebateAgent(BaseAgent):
         Synthesize the following debate rounds into a final analysis:
 
         Mid-term Memory (accumulated from all rounds):
-        {self._get_mid_term_info()}
+        {mid_str}
 
         Short-term Memory (just last round):
-        {self._get_short_term_info()}
+        {short_str}
         
         Debate History:
-        {self._format_previous_rounds(debate_rounds)}
+        {history_str}
         
         Instructions:
         - Provide a balanced final analysis for each stock considered.
@@ -202,20 +385,80 @@ class DebateAgent(BaseAgent):
         - Provide a final recommendation considering all perspectives, including the extreme bull/bear, and overall risk/reward.
         """
 
-        return self._create_prompt(role, content)
-    
-    def _format_previous_rounds(self, debate_rounds: List[Dict[str, Any]]) -> str:
-        if not debate_rounds:
-            return "No previous arguments."
-        
-        formatted_rounds = []
-        for round_data in debate_rounds:
-            formatted_rounds.append(
-                f"Round {round_data['round']} ({round_data['perspective'].upper()}):\n"
-                f"{round_data['arguments']}\n"
+        return self._cached_prompt(role, content)
+
+    def _prompt_key(self, role: str, content: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        # Everything that shapes the response is part of the key: the tier selects the
+        # provider and its token limit
+        settings = (self.is_free_tier, self.config.get("model"), self.config.get("temperature"),
+                    self.config.get("max_tokens"))
+        for part in (*map(str, settings), role, content):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _cache_lookup(self, key: str) -> str | None:
+        with self._prompt_cache_lock:
+            if key in self._prompt_cache:
+                self._prompt_cache.move_to_end(key)
+                return self._prompt_cache[key]
+        return None
+
+    def _cache_store(self, key: str, response: str):
+        with self._prompt_cache_lock:
+            self._prompt_cache[key] = response
+            if len(self._prompt_cache) > self.prompt_cache_size:
+                self._prompt_cache.popitem(last=False)
+
+    def _cached_prompt(self, role: str, content: str) -> str:
+        """Create a prompt, reusing the response of an identical earlier prompt"""
+        key = self._prompt_key(role, content)
+        response = self._cache_lookup(key)
+        if response is None:
+            response = self._create_prompt_with_retry(role, content)
+            self._cache_store(key, response)
+        return response
+
+    def _cached_prompts(self, prompts: List[Tuple[str, str]]) -> List[str]:
+        """Create a round's prompts concurrently, skipping those answered before"""
+        keys = [self._prompt_key(role, content) for role, content in prompts]
+        responses = [self._cache_lookup(key) for key in keys]
+
+        misses = [i for i, response in enumerate(responses) if response is None]
+
+        def store(miss: int, response: str):
+            # Cache each success as it comes in, so a retry after one failed prompt only
+            # resends the prompts that actually failed
+            i = misses[miss]
+            responses[i] = response
+            self._cache_store(keys[i], response)
+
+        if misses:
+            self._create_prompts([prompts[i] for i in misses], self.max_concurrency, on_response=store)
+        return responses
+
+    def _summarize_consensus(self, stock_stances: Dict[str, List[str]], history_str: str) -> str:
+        """Build the final analysis for a debate the experts settled in its opening round"""
+        voters = len(self.expert_roles)
+        consensus_lines = []
+        for symbol, stances in stock_stances.items():
+            majority = self._majority(stances, voters)
+            consensus_lines.append(
+                f"- {symbol}: {majority.capitalize()} consensus ({stances.count(majority)}/{voters} expert analysts)"
             )
-        
-        return "\n".join(formatted_rounds)
+        consensus_str = "\n".join(consensus_lines)
+
+        return f"""The expert analysts ({', '.join(self.expert_roles)}) reached consensus in the opening round of the debate.
+
+Consensus by stock:
+{consensus_str}
+
+Analyst arguments:
+{history_str}"""
+
+    def _format_round(self, round_num: int, perspective: str, arguments: str) -> str:
+        return f"Round {round_num} ({perspective.upper()}):\n{arguments}\n"
 
     def _get_mid_term_info(self) -> str:
         if not self.mid_term_memory:
@@ -223,86 +466,74 @@ class DebateAgent(BaseAgent):
         return " | ".join(self.mid_term_memory)
 
     def _get_short_term_info(self) -> str:
-        if not self.short_term_memory:
-            return "No short-term memory recorded."
-        return self.short_term_memory[-1]
+        return self.short_term_memory or "No short-term memory recorded."
 
-    def _calculate_confidence(self, debate_rounds: List[Dict[str, Any]], market_data: Dict[str, Any]) -> float:
+    def _calculate_confidence(self, debate_rounds: List[Dict[str, Any]], market_data: Dict[str, Any],
+                              expert_rounds: Dict[int, Dict[str, Any]] | None = None) -> float:
         confidence = 0.5
 
         if not debate_rounds:
             return confidence
 
-        total_rounds = max(r["round"] for r in debate_rounds)
-        expert_roles = ["fundamental", "technical", "risk"]
+        role_bits = {role: 1 << i for i, role in enumerate(self.expert_roles)}
+        all_experts = (1 << len(self.expert_roles)) - 1
+
+        # Bucket expert arguments by round in a single pass over the debate
+        total_rounds = 0
+        experts_by_round = defaultdict(list)
+        for r in debate_rounds:
+            total_rounds = max(total_rounds, r["round"])
+            if r["perspective"] in role_bits:
+                experts_by_round[r["round"]].append(r)
         
         sum_of_weights = total_rounds * (total_rounds + 1) / 2.0
         increments = 0.0 
 
-        domain_positive_terms = [
-            'strong momentum', 'investor confidence', 'reinforcing a positive outlook', 'upward momentum', 
-            'robust interest', 'healthy demand', 'resilience', 'favorable outlook', 'clearly', 'strongly', 
-            'definitely', 'consistently', 'well-supported', 'firm evidence', 'high conviction', 'no doubt', 
-            'strongly grounded', 'robust evidence', 'unwavering', 'highly credible', 'solid foundation',
-            'conclusive', 'authoritative', 'well-substantiated'
-        ]
-
-        domain_negative_terms = [
-            'regulatory scrutiny', 'downward movement', 'selling pressure', 'challenges', 'volatility', 'pressure',
-            'possibly', 'might', 'unclear', 'uncertain', 'tentative', 'questionable', 'ambiguous', 'unverified', 
-            'guesswork', 'speculation', 'lack of clarity', 'insufficient data', 'doubtfully', 'not guaranteed', 
-            'inconclusive', 'skeptical', 'dubious', 'no clear evidence'
-        ]
-
-
-        for round_num in range(1, total_rounds + 1):
-            current_round_experts = [r for r in debate_rounds if r["round"] == round_num and r["perspective"] in expert_roles]
-
-            if len(current_round_experts) < 3:
+        for round_num, current_round_experts in experts_by_round.items():
+            if len(current_round_experts) < len(self.expert_roles):
                 continue
 
+            # Reuse what _conduct_debate already parsed for this round when available
+            cached = expert_rounds.get(round_num) if expert_rounds else None
+
+            # Per stock, one bitmask of experts for each stance
             stock_stances = {}
-            all_arguments_text = [] 
             
             for entry in current_round_experts:
-                perspective = entry["perspective"]
-                lines = entry["arguments"].strip().split('\n')
-                for line in lines:
-                    line_stripped = line.strip()
-                    if line_stripped.lower().startswith("stock:"):
-                        parts = line_stripped.split('-', 1)
-                        if len(parts) != 2:
-                            continue
-                        stock_part = parts[0].replace("Stock:", "").strip()
-                        stance_part = parts[1].strip().lower()
-                        if stance_part.startswith("bullish"):
-                            stance = "bullish"
-                        elif stance_part.startswith("bearish"):
-                            stance = "bearish"
-                        else:
-                            stance = "neutral"
-
-                        if stock_part not in stock_stances:
-                            stock_stances[stock_part] = {}
-                        stock_stances[stock_part][perspective] = stance
-                    all_arguments_text.append(line_stripped.lower())
-
-            round_weight = round_num
-            for symbol, stances in stock_stances.items():
-                if len(stances) == 3:
-                    f_stance = stances.get("fundamental", "neutral")
-                    t_stance = stances.get("technical", "neutral")
-                    r_stance = stances.get("risk", "neutral")
-                    if f_stance == t_stance == r_stance and f_stance in ["bullish", "bearish"]:
-                        increments += 0.1 * round_weight
+                role_bit = role_bits[entry["perspective"]]
+                if cached:
+                    parsed = cached["stances"][entry["perspective"]]
+                else:
+                    parsed = _iter_stances(entry["arguments"])
+                for stock_part, stance in parsed:
+                    masks = stock_stances.setdefault(stock_part, {"bullish": 0, "bearish": 0, "neutral": 0})
+                    for key in masks:
+                        masks[key] &= ~role_bit
+                    masks[stance] |= role_bit
+
+            unanimous = split = 0
+            for symbol, masks in stock_stances.items():
+                if masks["bullish"] | masks["bearish"] | masks["neutral"] == all_experts:
+                    if masks["bullish"] == all_experts or masks["bearish"] == all_experts:
+                        unanimous += 1
                     else:
-                        increments -= 0.05 * round_weight
+                        split += 1
             
-            text_joined = " ".join(all_arguments_text)
-            domain_positive_count = sum(term in text_joined for term in domain_positive_terms)
-            domain_negative_count = sum(term in text_joined for term in domain_negative_terms)
-            increments += 0.005 * domain_positive_count * round_weight
-            increments -= 0.005 * domain_negative_count * round_weight
+            if cached:
+                round_text = cached["text"]
+            else:
+                round_text = self._join_lowercase([entry["arguments"] for entry in current_round_experts])
+            term_mask = _scan_domain_terms(round_text)
+            score_key = (
+                unanimous,
+                split,
+                (term_mask & POSITIVE_TERMS_MASK).bit_count(),
+                (term_mask & NEGATIVE_TERMS_MASK).bit_count()
+            )
+            round_score = _ROUND_SCORES.get(score_key)
+            if round_score is None:
+                round_score = _round_score(*score_key)
+            increments += round_score * round_num
 
         confidence += increments / sum_of_weights
 
@@ -67,10 +67,4 @@ class MemorySummaryAgent(BaseAgent):
         """
         Add the given summary to the mid-term memory list.
         """
-        memory_list.append(summary)
-
-    def add_to_short_term_memory(self, memory_list: List[str], summary: str):
-        """
-        Add the given summary to the short-term memory list.
-        """
         memory_list.append(summary)
\ No newline at end of file
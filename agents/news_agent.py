@@ -3,17 +3,35 @@ from newspaper import Article
 import yfinance as yf
 from agents import BaseAgent
 from config import NEWS_SOURCES
+from utils import file_cache
 from datetime import datetime, timedelta
 import pytz
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 from bs4 import BeautifulSoup
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+def create_http_session() -> requests.Session:
+    """Create an HTTP session with pooled keep-alive connections and retries on transient failures"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Shared by every NewsAgent so per-symbol requests reuse open connections
+SESSION = create_http_session()
+
 class NewsAgent(BaseAgent):
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], session: requests.Session | None = None):
         super().__init__(config)
         # All available sources
         self.available_sources = {
@@ -27,8 +45,8 @@ class NewsAgent(BaseAgent):
         # Default enabled sources (can be overridden)
         self.enabled_sources = config.get("enabled_sources", list(self.available_sources.keys()))
         
-        # Initialize session for better performance
-        self.session = requests.Session()
+        # Reuse the shared connection pool unless a session is provided
+        self.session = session or SESSION
         
         # Configure logging
         logging.basicConfig(level=logging.INFO)
@@ -282,8 +300,13 @@ class NewsAgent(BaseAgent):
                    f"&limit={limit}"
                    f"&apikey={self.alpha_vantage_key}")
             
-            response = self.session.get(url)
-            data = response.json()
+            # Alpha Vantage's free tier allows very few requests per day, so reuse recent responses
+            data = file_cache.get("alpha_vantage", {"url": url}, ttl=3600)
+            if data is None:
+                response = self.session.get(url)
+                data = response.json()
+                if data.get('feed'):
+                    file_cache.set("alpha_vantage", {"url": url}, data)
             
             articles = []
             
@@ -551,12 +574,16 @@ class NewsAgent(BaseAgent):
                 'Host': 'www.sec.gov'
             }
             
-            response = self.session.get(url, headers=headers)
-            if response.status_code != 200:
-                self.logger.error(f"Failed to get company tickers from SEC: {response.status_code}")
-                return None
-            
-            companies = response.json()
+            # The ticker list is several megabytes and rarely changes, so keep it on disk for a day
+            companies = file_cache.get("sec", {"url": url}, ttl=86400)
+            if companies is None:
+                response = self.session.get(url, headers=headers)
+                if response.status_code != 200:
+                    self.logger.error(f"Failed to get company tickers from SEC: {response.status_code}")
+                    return None
+                
+                companies = response.json()
+                file_cache.set("sec", {"url": url}, companies)
             
             # Search for the company by symbol
             for _, company in companies.items():
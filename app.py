@@ -1,16 +1,22 @@
 import streamlit as st
 import yfinance as yf
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import datetime
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from utils import get_market_data, load_historical_decisions
 from agents.coordinator_agent import CoordinatorAgent
-from config import AGENT_SETTINGS, TRADING_SETTINGS, NEWS_SOURCES, AVAILABLE_MODELS, FREE_TIER_SETTINGS
+from config import AGENT_SETTINGS, TRADING_SETTINGS, AVAILABLE_MODELS, FREE_TIER_SETTINGS
 import os
-import json
-from typing import Dict, Any
+import functools
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Fragments rerun on their own when their widgets change; they need Streamlit 1.33+,
+# so older versions fall back to ordinary full-script reruns
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
 
 # Page config
 st.set_page_config(
@@ -24,7 +30,7 @@ st.set_page_config(
     }
 )
 
-st.markdown("""
+_CSS = """
     <style>
     /* Theme-aware styles */
     .big-font {
@@ -80,35 +86,72 @@ st.markdown("""
         background-color: var(--st-color-background-secondary);
     }
     </style>
-""", unsafe_allow_html=True)
+"""
 
+# Streamlit drops elements that are not re-sent on a rerun, so the style block is emitted
+# every run; strip comments and indentation once so each rerun sends the minimum
+_CSS = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", _CSS, flags=re.DOTALL)).strip()
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_available_symbols():
-    """Get list of available symbols from utils/symbols.txt file"""
-    try:
-        with open('utils/symbols.txt', 'r') as f:
-            symbols = [line.strip() for line in f if line.strip()]
-        
-        return symbols
+def inject_css():
+    """Apply the app's custom styles"""
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_symbols() -> Tuple[str, ...]:
+    """Read the symbol universe from utils/symbols.txt once per process"""
+    with open('utils/symbols.txt', 'r') as f:
+        return tuple(line.strip() for line in f if line.strip())
 
+def get_available_symbols(prefix: str = "") -> Tuple[str, ...]:
+    """Get available symbols from utils/symbols.txt file, optionally narrowed to a prefix"""
+    try:
+        symbols = _read_symbols()
     except FileNotFoundError:
         st.error("Could not find utils/symbols.txt file")
-        return []
+        return ()
     except Exception as e:
         st.error(f"Error loading symbols: {str(e)}")
-        return []
-
-def plot_stock_price(symbol: str):
-    """Create a stock price chart using plotly"""
-    ticker = yf.Ticker(symbol)
-    hist = ticker.history(period='6mo')
+        return ()
     
-    fig = go.Figure(data=[go.Candlestick(x=hist.index,
-                open=hist['Open'],
-                high=hist['High'],
-                low=hist['Low'],
-                close=hist['Close'])])
+    prefix = prefix.strip().upper()
+    if prefix:
+        return tuple(symbol for symbol in symbols if symbol.startswith(prefix))
+    return symbols
+
+@st.cache_resource
+def get_ticker(symbol: str) -> yf.Ticker:
+    """Get a yfinance Ticker shared across reruns and sessions"""
+    return yf.Ticker(symbol)
+
+@st.cache_data(ttl=600)  # Cache for 10 minutes
+def get_price_history(symbol: str) -> pd.DataFrame:
+    """Get 6 months of price history for a symbol"""
+    return get_ticker(symbol).history(period='6mo')
+
+@st.cache_data(ttl=600)  # Cache for 10 minutes
+def get_price_histories(symbols: Tuple[str, ...]) -> Dict[str, pd.DataFrame]:
+    """Download 6 months of price history for several symbols in one batched request"""
+    data = yf.download(list(symbols), period='6mo', group_by='ticker', auto_adjust=True,
+                       threads=True, progress=False)
+    if not isinstance(data.columns, pd.MultiIndex):
+        return {symbols[0]: data}
+    
+    downloaded = set(data.columns.get_level_values(0))
+    return {symbol: data[symbol].dropna(how='all') for symbol in symbols if symbol in downloaded}
+
+@st.cache_resource(ttl=600)  # Cache for 10 minutes, matching the price history
+def plot_stock_price(symbol: str, _hist: pd.DataFrame):
+    """Create a stock price chart using plotly, reusing the figure across reruns"""
+    # Imported here so the script starts without loading plotly until a chart is drawn
+    import plotly.graph_objects as go
+    
+    # The history is left out of the cache key (leading underscore), so charts are keyed on symbol
+    fig = go.Figure(data=[go.Candlestick(x=_hist.index,
+                open=_hist['Open'],
+                high=_hist['High'],
+                low=_hist['Low'],
+                close=_hist['Close'])])
     
     fig.update_layout(
         title=f'{symbol} Stock Price',
@@ -119,6 +162,37 @@ def plot_stock_price(symbol: str):
     
     return fig
 
+MAX_MARKET_CONTEXT_ROWS = 50
+
+def show_market_table(df: pd.DataFrame):
+    """Display a market context table with floats rounded to 2 decimal places"""
+    # Round via column config rather than a pandas Styler, which renders every cell
+    # to HTML and slows st.dataframe considerably
+    st.dataframe(
+        df,
+        use_container_width=True,  # Make table full width
+        height=min(len(df) * 35 + 38, 500),  # Dynamic height based on rows
+        column_config={
+            column: st.column_config.NumberColumn(format="%.2f")
+            for column in df.select_dtypes('float').columns
+        }
+    )
+
+@fragment
+def price_charts(symbols: List[str]):
+    """Display a price chart for each symbol, isolated from reruns elsewhere on the page"""
+    st.markdown('<p class="big-font">Price Charts</p>', unsafe_allow_html=True)
+    price_histories = get_price_histories(tuple(sorted(symbols)))
+    cols = st.columns(len(symbols))
+    for col, symbol in zip(cols, symbols):
+        with col:
+            hist = price_histories.get(symbol)
+            if hist is None or hist.empty:
+                # Fall back to a single-symbol request if the batch missed it
+                hist = get_price_history(symbol)
+            fig = plot_stock_price(symbol, hist)
+            st.plotly_chart(fig, use_container_width=True)
+
 def display_analysis_results(result):
     """Display the analysis results in a structured format"""
     # Display confidence score
@@ -130,19 +204,18 @@ def display_analysis_results(result):
 
     # Display symbol signals
     signals = result['final_decision']['symbol_signals']
-    print(signals)
-    cols = st.columns(len(signals))
-    
-    for col, (symbol, signal) in zip(cols, signals.items()):
-        with col:
-            st.markdown(
-                f"<div class='analysis-box'>"
-                f"<h3>{symbol}</h3>"
-                f"<p class='{'signal-positive' if signal else 'signal-negative'}'>"
-                f"{'BULLISH' if signal else 'BEARISH'}</p>"
-                f"</div>",
-                unsafe_allow_html=True
-            )
+    logger.debug("Symbol signals: %s", signals)
+    
+    # Lay the cards out in one flex container so they render as a single element
+    cards = "".join(
+        f"<div class='analysis-box' style='flex:1'>"
+        f"<h3>{symbol}</h3>"
+        f"<p class='{'signal-positive' if signal else 'signal-negative'}'>"
+        f"{'BULLISH' if signal else 'BEARISH'}</p>"
+        f"</div>"
+        for symbol, signal in signals.items()
+    )
+    st.markdown(f"<div style='display:flex;gap:1rem'>{cards}</div>", unsafe_allow_html=True)
     
     # Display final decision
     with st.expander("View Detailed Analysis", expanded=True):
@@ -153,20 +226,15 @@ def display_analysis_results(result):
     st.markdown('### Market Context')
     market_data = result['final_decision']['market_context']
     if market_data:
-        df = pd.DataFrame(market_data).T
-        
-        # Style the dataframe
-        styled_df = df.style.set_properties(**{
-            'font-size': '1rem',
-            'padding': '0.5rem'
-        }).format(precision=2)  # Round numeric values to 2 decimal places
+        # Transposing mixes value types per column, so restore numeric dtypes before formatting.
+        # The full price, volume and date series are already charted, so only the snapshot is sent
+        df = pd.DataFrame(market_data).T.infer_objects()
+        df = df.drop(columns=["prices", "volumes", "dates"], errors="ignore")
         
-        # Display the styled dataframe with custom parameters
-        st.dataframe(
-            styled_df,
-            use_container_width=True,  # Make table full width
-            height=min(len(market_data) * 35 + 38, 500),  # Dynamic height based on rows
-        )
+        show_market_table(df.head(MAX_MARKET_CONTEXT_ROWS))
+        if len(df) > MAX_MARKET_CONTEXT_ROWS:
+            with st.expander(f"Show remaining {len(df) - MAX_MARKET_CONTEXT_ROWS} symbols"):
+                show_market_table(df.iloc[MAX_MARKET_CONTEXT_ROWS:])
     else:
         st.info("No market context data available")
 
@@ -218,16 +286,18 @@ def show_agent_output(agent_type: str, output: dict):
                 # Price Analysis
                 if 'price_analysis' in llr:
                     st.markdown("#### Technical Analysis")
-                    for symbol, analysis in llr['price_analysis'].items():
-                        st.markdown(f"**{symbol}**")
-                        st.markdown(analysis)
+                    st.markdown("\n\n".join(
+                        f"**{symbol}**\n\n{analysis}"
+                        for symbol, analysis in llr['price_analysis'].items()
+                    ))
                 
                 # Reasonings
                 if 'reasonings' in llr:
                     st.markdown("#### Market Reasoning")
-                    for timeframe, reasoning in llr['reasonings'].items():
-                        if reasoning != "Medium Term analysis pending.":
-                            st.markdown(reasoning)
+                    st.markdown("\n\n".join(
+                        reasoning for reasoning in llr['reasonings'].values()
+                        if reasoning != "Medium Term analysis pending."
+                    ))
             
             # High Level Reflection Section
             if 'high_level_reflection' in output:
@@ -249,111 +319,53 @@ def show_agent_output(agent_type: str, output: dict):
             st.write("Debate Analysis:")
             st.markdown(output.get('debate_analysis', 'No analysis available'))
             if 'debate_rounds' in output:
-                for round_data in output['debate_rounds']:
-                    st.write(f"\nRound {round_data['round']} ({round_data['perspective'].upper()}):")
-                    st.markdown(round_data['arguments'])
+                st.markdown("\n\n".join(
+                    f"Round {round_data['round']} ({round_data['perspective'].upper()}):\n\n{round_data['arguments']}"
+                    for round_data in output['debate_rounds']
+                ))
             st.write(f"Confidence Score: {output.get('confidence_score', 0):.2%}")
 
-def config_sidebar():
-    """Create the configuration sidebar"""
-    st.sidebar.title("Configuration")
-    
-    # Tier Selection
-    st.session_state.tier = st.sidebar.radio(
-        "Select Tier",
-        ["Premium", "Free"],
-        index=0,
-        help="Premium tier uses OpenAI models. Free tier uses HuggingFace models."
-    )
-    
-    if st.session_state.tier == "Premium":
-        # API Key Configuration
-        st.sidebar.subheader("OpenAI API Key")
-        api_key = st.sidebar.text_input(
-            "Enter your OpenAI API key",
-            type="password",
-            help="Your API key will not be stored and will only be used for this session",
-            key="openai_api_key"
-        )
-        
-        # Model Configuration Section
-        if api_key:
-            st.sidebar.subheader("Model Settings")
+@fragment
+def model_settings():
+    """Create the per-agent model settings, rerunning on their own when changed"""
+    st.subheader("Model Settings")
+    
+    # Create tabs for different agent configurations
+    agent_tabs = st.tabs(["News", "Reflection", "Debate", "Coordinator"])
+    
+    for agent, tab in zip(AGENT_SETTINGS.keys(), agent_tabs):
+        with tab:
+            st.selectbox(
+                "Model",
+                options=AVAILABLE_MODELS["premium"],
+                key=f"{agent}_model",
+                index=AVAILABLE_MODELS["premium"].index(AGENT_SETTINGS[agent]["model"]) 
+                    if AGENT_SETTINGS[agent]["model"] in AVAILABLE_MODELS["premium"] else 2
+            )
             
-            # Create tabs for different agent configurations
-            agent_tabs = st.sidebar.tabs(["News", "Reflection", "Debate", "Coordinator"])
+            st.slider(
+                "Temperature",
+                min_value=0.0,
+                max_value=1.0,
+                value=AGENT_SETTINGS[agent]["temperature"],
+                step=0.1,
+                key=f"{agent}_temp"
+            )
             
-            for agent, tab in zip(AGENT_SETTINGS.keys(), agent_tabs):
-                with tab:
-                    st.selectbox(
-                        "Model",
-                        options=AVAILABLE_MODELS["premium"],
-                        key=f"{agent}_model",
-                        index=AVAILABLE_MODELS["premium"].index(AGENT_SETTINGS[agent]["model"]) 
-                            if AGENT_SETTINGS[agent]["model"] in AVAILABLE_MODELS["premium"] else 2
-                    )
-                    
-                    st.slider(
-                        "Temperature",
-                        min_value=0.0,
-                        max_value=1.0,
-                        value=AGENT_SETTINGS[agent]["temperature"],
-                        step=0.1,
-                        key=f"{agent}_temp"
-                    )
-                    
-                    st.number_input(
-                        "Max Tokens",
-                        min_value=100,
-                        max_value=4000,
-                        value=AGENT_SETTINGS[agent]["max_tokens"],
-                        step=100,
-                        key=f"{agent}_tokens"
-                    )
-    else:
-        # Display prominent warning for free tier
-        st.sidebar.warning("""
-        ⚠️ **WARNING: Free Tier Limitations** ⚠️
-        
-        The free tier uses basic HuggingFace models with significant limitations:
-        - Severely reduced performance
-        - Limited context understanding
-        - Basic response quality
-        - Truncated inputs due to token limits
-        
-        This tier is intended for testing and development only.
-        For actual trading analysis, please use the Premium tier with OpenAI models.
-        """, icon="⚠️")
-        
-        # Free tier configuration
-        st.sidebar.subheader("HuggingFace API Key")
-        hf_api_key = st.sidebar.text_input(
-            "Enter your HuggingFace API key",
-            type="password",
-            help="Get a free API key from huggingface.co",
-            key="huggingface_api_key"
-        )
-        
-        # Free tier model selection with warning
-        st.sidebar.subheader("Model Selection")
-        selected_model = st.sidebar.selectbox(
-            "Select Free Model",
-            options=AVAILABLE_MODELS["free"],
-            index=0,
-            help="⚠️ These models have limited capabilities and are for testing only"
-        )
-        FREE_TIER_SETTINGS["model"] = selected_model
-        
-        # Update all agents to use the selected free model
-        for agent in AGENT_SETTINGS:
-            AGENT_SETTINGS[agent].update(FREE_TIER_SETTINGS)
-        
-        # Pass the API key to the agent config
-        for agent in AGENT_SETTINGS:
-            AGENT_SETTINGS[agent]["huggingface_api_key"] = hf_api_key
-    
+            st.number_input(
+                "Max Tokens",
+                min_value=100,
+                max_value=4000,
+                value=AGENT_SETTINGS[agent]["max_tokens"],
+                step=100,
+                key=f"{agent}_tokens"
+            )
+
+@fragment
+def analysis_settings():
+    """Create the agent, trading and news settings, rerunning on their own when changed"""
     # Agent Enable/Disable Section
-    st.sidebar.subheader("Enable/Disable Agents")
+    st.subheader("Enable/Disable Agents")
     
     # Initialize session state for agent toggles if not exists
     if "enabled_agents" not in st.session_state:
@@ -364,35 +376,35 @@ def config_sidebar():
         }
     
     # Create toggles for each agent except coordinator
-    st.session_state.enabled_agents["news_agent"] = st.sidebar.checkbox(
+    st.session_state.enabled_agents["news_agent"] = st.checkbox(
         "News Agent",
         value=st.session_state.enabled_agents["news_agent"],
         help="Analyzes current news and market sentiment"
     )
-
-    st.session_state.enabled_agents["reflection_agent"] = st.sidebar.checkbox(
+    
+    st.session_state.enabled_agents["reflection_agent"] = st.checkbox(
         "Reflection Agent",
         value=st.session_state.enabled_agents["reflection_agent"],
         help="Analyzes historical decisions and patterns"
     )
-
-    st.session_state.enabled_agents["debate_agent"] = st.sidebar.checkbox(
+    
+    st.session_state.enabled_agents["debate_agent"] = st.checkbox(
         "Debate Agent",
         value=st.session_state.enabled_agents["debate_agent"],
         help="Creates pros and cons analysis"
     )
     
     # Trading Settings Section
-    st.sidebar.subheader("Trading Settings")
+    st.subheader("Trading Settings")
     
-    st.sidebar.selectbox(
+    st.selectbox(
         "Analysis Timeframe",
-        options=["1d", "5d", "1mo", "3mo", "6mo", "1y"],
-        index=["1d", "5d", "1mo", "3mo", "6mo", "1y"].index(TRADING_SETTINGS["analysis_timeframe"]),
+        options=list(_TIMEFRAME_DAYS),
+        index=list(_TIMEFRAME_DAYS).index(TRADING_SETTINGS["analysis_timeframe"]),
         key="analysis_timeframe"
     )
     
-    st.sidebar.slider(
+    st.slider(
         "Risk Tolerance",
         min_value=0.01,
         max_value=0.10,
@@ -413,7 +425,7 @@ def config_sidebar():
             "sec"
         ]
     
-    st.session_state.news_sources = st.sidebar.multiselect(
+    st.session_state.news_sources = st.multiselect(
         "News Sources",
         options=[
             "yfinance",
@@ -427,31 +439,115 @@ def config_sidebar():
     )
     
     # Apply Configuration Button
-    if st.sidebar.button("Apply Configuration"):
+    if st.button("Apply Configuration"):
         update_config()
-        st.sidebar.success("Configuration updated successfully!")
+        st.success("Configuration updated successfully!")
+    
+def config_sidebar():
+    """Create the configuration sidebar"""
+    st.sidebar.title("Configuration")
+    
+    # Tier Selection
+    st.session_state.tier = st.sidebar.radio(
+        "Select Tier",
+        ["Premium", "Free"],
+        index=0,
+        help="Premium tier uses OpenAI models. Free tier uses HuggingFace models."
+    )
+    
+    if st.session_state.tier == "Premium":
+        # API Key Configuration
+        st.sidebar.subheader("OpenAI API Key")
+        api_key = st.sidebar.text_input(
+            "Enter your OpenAI API key",
+            type="password",
+            help="Your API key will not be stored and will only be used for this session",
+            key="openai_api_key"
+        )
+        
+        # Model Configuration Section
+        if api_key:
+            with st.sidebar:
+                model_settings()
+    else:
+        # Display prominent warning for free tier
+        st.sidebar.warning("""
+        ⚠️ **WARNING: Free Tier Limitations** ⚠️
+        
+        The free tier uses basic HuggingFace models with significant limitations:
+        - Severely reduced performance
+        - Limited context understanding
+        - Basic response quality
+        - Truncated inputs due to token limits
+        
+        This tier is intended for testing and development only.
+        For actual trading analysis, please use the Premium tier with OpenAI models.
+        """, icon="⚠️")
+        
+        # Free tier configuration
+        st.sidebar.subheader("HuggingFace API Key")
+        st.sidebar.text_input(
+            "Enter your HuggingFace API key",
+            type="password",
+            help="Get a free API key from huggingface.co",
+            key="huggingface_api_key"
+        )
+        
+        # Free tier model selection with warning
+        st.sidebar.subheader("Model Selection")
+        # Applied to the agent settings when an analysis runs, see apply_free_tier_settings
+        st.sidebar.selectbox(
+            "Select Free Model",
+            options=AVAILABLE_MODELS["free"],
+            index=0,
+            help="⚠️ These models have limited capabilities and are for testing only",
+            key="free_tier_model"
+        )
+    
+    with st.sidebar:
+        analysis_settings()
+
+# Keys are exactly the options offered by the Analysis Timeframe selector
+_TIMEFRAME_DAYS = {"1d": 1, "5d": 5, "1mo": 30, "3mo": 90, "6mo": 180, "1y": 365}
 
 def parse_timeframe_to_days(timeframe: str) -> int:
     """Convert timeframe string to number of days"""
     timeframe = timeframe.lower()
-    if timeframe == "1d":
-        return 1
-    elif timeframe == "1w":
-        return 7
-    elif timeframe == "2w":
-        return 14
-    elif timeframe == "1m":
-        return 30
-    elif timeframe == "3m":
-        return 90
-    elif timeframe == "6m":
-        return 180
-    elif timeframe == "1y":
-        return 365
-    else:
-        return 30  # Default to 1 month
+    assert timeframe in _TIMEFRAME_DAYS, f"Unknown analysis timeframe: {timeframe}"
+    return _TIMEFRAME_DAYS.get(timeframe, 30)  # Default to 1 month
+
+def apply_free_tier_settings():
+    """Point every agent at this session's free model and HuggingFace key"""
+    # AGENT_SETTINGS is shared by all sessions, so this runs right before each coordinator is built
+    free_settings_with_key = {
+        **FREE_TIER_SETTINGS,
+        "model": st.session_state.free_tier_model,
+        "huggingface_api_key": st.session_state.huggingface_api_key
+    }
+    for agent in AGENT_SETTINGS:
+        AGENT_SETTINGS[agent].update(free_settings_with_key)
+
+def run_agents_concurrently(tasks: Dict[str, Tuple[Callable, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Run independent agent analyses in parallel threads
+    
+    Args:
+        tasks: Mapping of agent name to its analyze callable and input payload
+        
+    Returns:
+        Mapping of agent name to its analysis, or to the exception it raised so that
+        one failing agent does not discard the others' results
+    """
+    if not tasks:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {name: executor.submit(analyze, payload) for name, (analyze, payload) in tasks.items()}
+    
+    return {name: future.exception() or future.result() for name, future in futures.items()}
 
 def main():
+    inject_css()
     st.title("🤖 Multi-Agent Quants - AI Trading Analysis")
     
     # Get configuration from sidebar
@@ -459,12 +555,30 @@ def main():
     
     # Symbol selection in main page
     st.markdown('<p class="big-font">Select Symbols to Analyze</p>', unsafe_allow_html=True)
+    symbol_prefix = st.text_input(
+        "Filter Symbols",
+        placeholder="e.g. AA",
+        help="Narrow the symbol list by prefix before searching"
+    )
+    
+    # Keep the current selection among the options so filtering never drops it
+    st.session_state.setdefault("symbol_selection", ["AAPL", "MSFT", "GOOGL"])
+    current_selection = list(st.session_state.symbol_selection)
+    filtered_symbols = get_available_symbols(symbol_prefix)
+    options = tuple(current_selection) + tuple(
+        symbol for symbol in filtered_symbols if symbol not in current_selection
+    )
+    
+    # Changing the options gives the widget a new ID, so write the selection back to its key
+    # before the widget is created; the new widget then starts from it instead of resetting
+    st.session_state.symbol_selection = current_selection
+    
     selected_symbols = st.multiselect(
         "Enter Stock Symbols to Analyze",
-        options=get_available_symbols(),
-        default=["AAPL", "MSFT", "GOOGL"],
+        options=options,
         max_selections=5,
-        help="Type to search for any stock symbol"
+        help="Type to search for any stock symbol",
+        key="symbol_selection"
     )
     
     if not selected_symbols:
@@ -472,12 +586,7 @@ def main():
         st.stop()
     
     # Display stock charts
-    st.markdown('<p class="big-font">Price Charts</p>', unsafe_allow_html=True)
-    cols = st.columns(len(selected_symbols))
-    for col, symbol in zip(cols, selected_symbols):
-        with col:
-            fig = plot_stock_price(symbol)
-            st.plotly_chart(fig, use_container_width=True)
+    price_charts(selected_symbols)
 
     # Check for API keys based on tier
     if st.session_state.tier == "Premium":
@@ -500,10 +609,6 @@ def main():
             """)
             st.stop()
         os.environ["HUGGINGFACE_API_KEY"] = st.session_state.huggingface_api_key
-        
-        # Update all agents to use free tier settings
-        for agent in AGENT_SETTINGS:
-            AGENT_SETTINGS[agent].update(FREE_TIER_SETTINGS)
     
     # Create placeholder for real-time updates
     agent_outputs = st.empty()
@@ -512,72 +617,110 @@ def main():
     if st.button("Run Analysis", type="primary"):
         with st.spinner("Running AI analysis..."):
             try:
-                # Initialize coordinator
+                # One timestamp for the whole run so every agent sees the same analysis time
+                ts = datetime.now().isoformat()
+                
+                if st.session_state.tier == "Free":
+                    apply_free_tier_settings()
+                
+                # Build the agents per run so no memory carries over between runs or sessions;
+                # their LLM clients and HTTP session are shared and reused
                 coordinator = CoordinatorAgent(AGENT_SETTINGS["coordinator_agent"])
                 
-                # Prepare data
-                market_data = get_market_data(selected_symbols)
-                historical_decisions = load_historical_decisions()
+                # Prepare data, overlapping the market data requests with the CSV loading
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    market_data_future = executor.submit(get_market_data, selected_symbols)
+                    historical_decisions_future = executor.submit(load_historical_decisions)
+                market_data = market_data_future.result()
+                historical_decisions = historical_decisions_future.result()
+                
+                lookback_days = parse_timeframe_to_days(st.session_state.analysis_timeframe)
                 
                 # Create analysis context
                 analysis_context = {
                     "symbols": selected_symbols,
                     "market_data": market_data,
                     "historical_decisions": historical_decisions,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": ts,
                     "proposed_action": {
                         "type": "ANALYSIS",
                         "symbols": selected_symbols,
                         "risk_level": TRADING_SETTINGS["risk_tolerance"]
                     },
                     "enabled_agents": st.session_state.enabled_agents,
-                    "lookback_days": parse_timeframe_to_days(st.session_state.analysis_timeframe)
+                    "lookback_days": lookback_days
                 }
                 
+                news_analysis = reflection_analysis = debate_analysis = None
+                
                 # Initialize container for agent outputs
                 with agent_outputs.container():
                     st.markdown('<p class="big-font">Agent Outputs</p>', unsafe_allow_html=True)
 
                     
-                    # Only show enabled agent outputs
+                    # Phase 1: the news analysis feeds both remaining agents
                     if st.session_state.enabled_agents["news_agent"]:
                         news_analysis = coordinator.news_agent.analyze({
                             "symbols": selected_symbols,
-                            "timestamp": datetime.now().isoformat(),
-                            "lookback_days": parse_timeframe_to_days(st.session_state.analysis_timeframe),
+                            "timestamp": ts,
+                            "lookback_days": lookback_days,
                             "enabled_sources": st.session_state.news_sources
                         })
                         show_agent_output("news_agent", news_analysis)
                     
+                    # Phase 2: reflection and debate only depend on the news analysis,
+                    # so their LLM calls run concurrently
+                    phase_two = {}
                     if st.session_state.enabled_agents["reflection_agent"]:
-                        reflection_analysis = coordinator.reflection_agent.analyze({
+                        phase_two["reflection_agent"] = (coordinator.reflection_agent.analyze, {
                             "symbols": selected_symbols,
                             "news_analysis": news_analysis,
                             "risk_tolerance": TRADING_SETTINGS["risk_tolerance"],
                             "historical_decisions": historical_decisions,
                             "market_data": market_data,
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": ts
                         })
-                        show_agent_output("reflection_agent", reflection_analysis)
                     
                     if st.session_state.enabled_agents["debate_agent"]:
-                        debate_analysis = coordinator.debate_agent.analyze({
+                        phase_two["debate_agent"] = (coordinator.debate_agent.analyze, {
                             "market_data": market_data,
                             "proposed_action": analysis_context["proposed_action"],
-                            "timestamp": datetime.now().isoformat(),
-                            "news_analysis": news_analysis,
-                            "reflection_analysis": reflection_analysis
+                            "timestamp": ts,
+                            "news_analysis": news_analysis
                         })
-                        show_agent_output("debate_agent", debate_analysis)
+                    
+                    phase_two_results = run_agents_concurrently(phase_two)
+                    
+                    # Render on the script thread; surface the first failure only after
+                    # showing whatever the other agent produced
+                    phase_two_errors = []
+                    for agent_type, output in phase_two_results.items():
+                        if isinstance(output, Exception):
+                            phase_two_errors.append(output)
+                        else:
+                            show_agent_output(agent_type, output)
+                    if phase_two_errors:
+                        raise phase_two_errors[0]
+                    
+                    reflection_analysis = phase_two_results.get("reflection_agent")
+                    debate_analysis = phase_two_results.get("debate_agent")
+                    
+                    # Only the agents that ran take part in weighting and synthesis
+                    analyses = {
+                        name: analysis
+                        for name, analysis in (
+                            ("news", news_analysis),
+                            ("reflection", reflection_analysis),
+                            ("debate", debate_analysis)
+                        )
+                        if analysis is not None
+                    }
                     
                     # Get agent weights
-                    confidence_scores = {}
-                    if st.session_state.enabled_agents["news_agent"]:
-                        confidence_scores["news"] = news_analysis.get("confidence_score", 0)
-                    if st.session_state.enabled_agents["reflection_agent"]:
-                        confidence_scores["reflection"] = reflection_analysis.get("reflection_analysis", {}).get("confidence_score", 0)
-                    if st.session_state.enabled_agents["debate_agent"]:
-                        confidence_scores["debate"] = debate_analysis.get("confidence_score", 0)
+                    confidence_scores = {
+                        name: coordinator._agent_confidence(name, analysis)
+                        for name, analysis in analyses.items()
+                    }
                     
                     weights = coordinator._get_agent_weights(
                         confidence_scores,
@@ -585,24 +728,12 @@ def main():
                     )
                     
                     # Get final decision
-                    result = coordinator._synthesize_analyses(
-                        news_analysis if st.session_state.enabled_agents["news_agent"] else None,
-                        reflection_analysis if st.session_state.enabled_agents["reflection_agent"] else None,
-                        debate_analysis if st.session_state.enabled_agents["debate_agent"] else None,
-                        analysis_context,
-                        weights
-                    )
+                    result = coordinator._synthesize_analyses(analyses, analysis_context, weights)
                     
                     # Display final results
                     st.markdown('<p class="big-font">Final Analysis</p>', unsafe_allow_html=True)
                     display_analysis_results({
-                        "confidence_score": coordinator._calculate_overall_confidence(
-                            news_analysis if st.session_state.enabled_agents["news_agent"] else None,
-                            reflection_analysis if st.session_state.enabled_agents["reflection_agent"] else None,
-                            debate_analysis if st.session_state.enabled_agents["debate_agent"] else None,
-                            st.session_state.enabled_agents,
-                            weights
-                        ),
+                        "confidence_score": coordinator._calculate_overall_confidence(analyses, weights),
                         "final_decision": result
                     })
             
@@ -1,39 +1,118 @@
 import yfinance as yf
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Callable
 from datetime import datetime
 from config import TRADING_SETTINGS
+import functools
+import hashlib
+import json
 import logging
 import os
+import tempfile
+import time
 import pandas as pd
 
-def get_market_data(symbols: List[str]) -> Dict[str, Any]:
-    """Fetch market data for given symbols"""
-    market_data = {}
-    for symbol in symbols:
+CACHE_DIR = ".cache"
+
+def _to_json(value: Any) -> Any:
+    """Convert numpy scalars and other non-JSON values for serialization"""
+    return value.item() if hasattr(value, "item") else str(value)
+
+class FileCache:
+    """JSON file cache stored as {cache_dir}/{endpoint}/{md5(params)}.json with a time-to-live"""
+    
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache_dir = cache_dir
+    
+    def _path(self, endpoint: str, params: Any) -> str:
+        key = hashlib.md5(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+        return os.path.join(self.cache_dir, endpoint, f"{key}.json")
+    
+    def get(self, endpoint: str, params: Any, ttl: float) -> Any:
+        """Return the cached data for these parameters, or None if missing or older than ttl seconds"""
+        path = self._path(endpoint, params)
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=TRADING_SETTINGS["analysis_timeframe"])
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            logging.info(f"Cache miss: {path}")
+            return None
+        
+        if time.time() - entry.get("timestamp", 0) > ttl:
+            logging.info(f"Cache expired: {path}")
+            return None
+        
+        logging.info(f"Cache hit: {path}")
+        return entry.get("data")
+    
+    def set(self, endpoint: str, params: Any, data: Any):
+        """Store data for these parameters, replacing the file atomically"""
+        path = self._path(endpoint, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump({"timestamp": time.time(), "data": data}, f, default=_to_json)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logging.error(f"Error writing cache file {path}: {str(e)}")
+
+file_cache = FileCache()
+
+def cached(endpoint: str, ttl: float = 3600) -> Callable:
+    """Cache a function's JSON-serializable result on disk, keyed on its arguments"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            params = {"args": args, "kwargs": kwargs}
+            data = file_cache.get(endpoint, params, ttl)
+            if data is None:
+                data = func(*args, **kwargs)
+                # Empty results usually mean a failed fetch, so they are not cached
+                if data:
+                    file_cache.set(endpoint, params, data)
+            return data
+        return wrapper
+    return decorator
+
+@cached(endpoint="market", ttl=3600)
+def _fetch_symbol_data(symbol: str, period: str) -> Dict[str, Any] | None:
+    """Fetch market data for a single symbol, or None if it could not be retrieved"""
+    try:
+        ticker = yf.Ticker(symbol)
+        hist = ticker.history(period=period)
+        
+        # Add required fields for reflection agent
+        return {
+            # Historical data series
+            "prices": hist["Close"].tolist(),
+            "volumes": hist["Volume"].tolist(),
+            "dates": [d.strftime('%Y-%m-%d') for d in hist.index],
             
-            # Add required fields for reflection agent
-            market_data[symbol] = {
-                # Historical data series
-                "prices": hist["Close"].tolist(),
-                "volumes": hist["Volume"].tolist(),
-                "dates": [d.strftime('%Y-%m-%d') for d in hist.index],
-                
-                # Current snapshot
-                "current_price": hist["Close"].iloc[-1],
-                "open": hist["Open"].iloc[-1],
-                "high": hist["High"].iloc[-1],
-                "low": hist["Low"].iloc[-1],
-                "volume": hist["Volume"].iloc[-1],
-                "change_percent": ((hist["Close"].iloc[-1] - hist["Open"].iloc[-1]) / hist["Open"].iloc[-1]) * 100
-            }
-        except Exception as e:
-            print(f"Error fetching data for {symbol}: {str(e)}")
-            continue
+            # Current snapshot
+            "current_price": hist["Close"].iloc[-1],
+            "open": hist["Open"].iloc[-1],
+            "high": hist["High"].iloc[-1],
+            "low": hist["Low"].iloc[-1],
+            "volume": hist["Volume"].iloc[-1],
+            "change_percent": ((hist["Close"].iloc[-1] - hist["Open"].iloc[-1]) / hist["Open"].iloc[-1]) * 100
+        }
+    except Exception as e:
+        print(f"Error fetching data for {symbol}: {str(e)}")
+        return None
+
+def get_market_data(symbols: List[str]) -> Dict[str, Any]:
+    """Fetch market data for given symbols, requesting them concurrently"""
+    if not symbols:
+        return {}
     
-    return market_data
+    # Each symbol is cached on its own, so a failed fetch is retried on the next call
+    # instead of being cached as a missing symbol
+    period = TRADING_SETTINGS["analysis_timeframe"]
+    with ThreadPoolExecutor(max_workers=min(16, len(symbols))) as executor:
+        results = list(executor.map(_fetch_symbol_data, symbols, [period] * len(symbols)))
+    
+    return {symbol: data for symbol, data in zip(symbols, results) if data is not None}
 
 def load_historical_decisions() -> List[Dict[str, Any]]:
     """
@@ -42,18 +121,25 @@ def load_historical_decisions() -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries containing historical decisions with their results
     """
-    historical_decisions = []
     eval_dir = "evaluation_results"
     
     # Create directory if it doesn't exist
     if not os.path.exists(eval_dir):
         os.makedirs(eval_dir)
-        return historical_decisions
+        return []
+    
+    # Find all CSV files in the directory; their modification times key the parsed cache
+    csv_files = sorted(f for f in os.listdir(eval_dir) if f.endswith('.csv'))
+    csv_state = [(f, os.path.getmtime(os.path.join(eval_dir, f))) for f in csv_files]
     
-    # Find all CSV files in the directory
-    csv_files = [f for f in os.listdir(eval_dir) if f.endswith('.csv')]
+    return _parse_historical_decisions(eval_dir, csv_state)
+
+@cached(endpoint="historical_decisions", ttl=86400)
+def _parse_historical_decisions(eval_dir: str, csv_state: List[tuple]) -> List[Dict[str, Any]]:
+    """Parse historical decisions from the listed CSV files, sorted by timestamp"""
+    historical_decisions = []
     
-    for csv_file in csv_files:
+    for csv_file, _ in csv_state:
         try:
             # Read CSV file
             df = pd.read_csv(os.path.join(eval_dir, csv_file))
@@ -84,4 +170,4 @@ def load_historical_decisions() -> List[Dict[str, Any]]:
     # Sort by timestamp
     historical_decisions.sort(key=lambda x: datetime.fromisoformat(x['timestamp']))
     
-    return historical_decisions
\ No newline at end of file
+    return historical_decisions